@@ -8,11 +8,15 @@ import os
 from datetime import datetime
 import json
 import argparse
+import re
+import tempfile
+import xml.etree.ElementTree as ET
 
 # Add the current directory to the path to import modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from model import XlitToolModel
+from tmx_exporter import TMXExporter
 
 class TransliterationTestSuite:
     """Refactored comprehensive test suite with unified test runner."""
@@ -142,6 +146,150 @@ class TransliterationTestSuite:
         
         return method_results
     
+    def run_tmx_tests(self):
+        """Check TMX line pairing and that streamed file output matches the tree export."""
+        print("\n=== Testing TMX export ===")
+        
+        method_name = "Russian (Cyrillic)-->English (IC)"
+        tmx_test_cases = [
+            {
+                "name": "line_pairing",
+                "input": "один\nдва\n\nтри",
+                "expected": [("один", "odin"), ("два", "dva"), ("три", "tri")],
+                "description": "Blank lines are skipped without shifting later pairs"
+            },
+            {
+                "name": "crlf_line_endings",
+                "input": "один\r\nдва",
+                "expected": [("один", "odin"), ("два", "dva")],
+                "description": "CRLF line endings do not leave a '\\r' in the segments"
+            },
+            {
+                "name": "vertical_tab_in_source",
+                "input": "один\x0bдва\nтри",
+                "expected": [("один\x0bдва", "odindva"), ("три", "tri")],
+                "description": "A manual line break ('\\x0b') stays inside its line, so pairs stay aligned"
+            },
+        ]
+        
+        exporter = TMXExporter()
+        tmx_results = []
+        for test_case in tmx_test_cases:
+            success, result, error, warnings = self.model.transliterate(
+                method_name, test_case["input"], False
+            )
+            units = exporter._iter_translation_units(test_case["input"], result, "ru", "en")
+            actual = [(tu[0][0].text, tu[1][0].text) for tu in units]
+            passed = success and actual == test_case["expected"]
+            tmx_results.append({
+                "method": "TMX export",
+                "name": test_case["name"],
+                "description": test_case["description"],
+                "input": test_case["input"],
+                "expected": repr(test_case["expected"]),
+                "actual": repr(actual),
+                "match_case": False,
+                "success": success,
+                "error": error,
+                "warnings": warnings,
+                "passed": passed
+            })
+            
+            status = "✓" if passed else "✗"
+            print(f"   {status} {test_case['name']}: {actual!r}")
+            if not passed:
+                print(f"     Expected: {test_case['expected']!r}")
+        
+        # Streamed file writing must match building the whole tree and
+        # exporting it, apart from the creation timestamp
+        tmx_file_test_cases = [
+            {
+                "name": "write_file_compact",
+                "source": "один\nдва\n\nтри",
+                "target": "odin\ndva\n\ntri",
+                "pretty": False,
+                "description": "Compact streamed file parses and matches export_to_file"
+            },
+            {
+                "name": "write_file_pretty",
+                "source": "один\nдва\n\nтри",
+                "target": "odin\ndva\n\ntri",
+                "pretty": True,
+                "description": "Indented streamed file parses and matches export_to_file"
+            },
+            {
+                "name": "write_file_no_units",
+                "source": "",
+                "target": "",
+                "pretty": False,
+                "description": "A file without translation units has an empty <body />"
+            },
+            {
+                "name": "write_file_no_units_pretty",
+                "source": "",
+                "target": "",
+                "pretty": True,
+                "description": "An indented file without translation units has an empty <body />"
+            },
+        ]
+        
+        creation_date_pattern = re.compile(rb'creationdate="[^"]*"')
+        with tempfile.TemporaryDirectory() as temp_dir:
+            streamed_path = os.path.join(temp_dir, "streamed.tmx")
+            reference_path = os.path.join(temp_dir, "reference.tmx")
+            for test_case in tmx_file_test_cases:
+                error = ""
+                try:
+                    success, error = exporter.write_tmx_file(
+                        test_case["source"], test_case["target"], streamed_path,
+                        method_name=method_name, pretty=test_case["pretty"]
+                    )
+                    ET.parse(streamed_path)
+                    reference_root = exporter.create_tmx_document(
+                        test_case["source"], test_case["target"], method_name=method_name
+                    )
+                    exporter.export_to_file(reference_root, reference_path, pretty=test_case["pretty"])
+                    
+                    with open(streamed_path, 'rb') as f:
+                        streamed = creation_date_pattern.sub(b'', f.read())
+                    with open(reference_path, 'rb') as f:
+                        reference = creation_date_pattern.sub(b'', f.read())
+                    passed = success and streamed == reference
+                    if not test_case["source"]:
+                        passed = passed and b'<body />' in streamed
+                    actual = streamed.decode('utf-8')
+                    expected = reference.decode('utf-8')
+                except Exception as e:
+                    success, passed, actual, expected = False, False, "", ""
+                    error = f"Test execution error: {str(e)}"
+                
+                tmx_results.append({
+                    "method": "TMX export",
+                    "name": test_case["name"],
+                    "description": test_case["description"],
+                    "input": test_case["source"],
+                    "expected": expected,
+                    "actual": actual,
+                    "match_case": False,
+                    "success": success,
+                    "error": error,
+                    "warnings": [],
+                    "passed": passed
+                })
+                
+                status = "✓" if passed else "✗"
+                print(f"   {status} {test_case['name']}")
+                if not passed:
+                    if error:
+                        print(f"     Error: {error}")
+                    else:
+                        print(f"     Expected: {expected!r}, Got: {actual!r}")
+        
+        passed = sum(1 for r in tmx_results if r["passed"])
+        print(f"   Summary: {passed}/{len(tmx_results)} tests passed")
+        
+        return tmx_results
+    
     def run_all_tests(self, method_filter=None, failed_only=False):
         """Run comprehensive tests for all transliteration methods."""
         if method_filter:
@@ -179,6 +327,12 @@ class TransliterationTestSuite:
             if failed:
                 self.failed_tests.extend(failed)
         
+        # TMX export checks are not tied to a single method
+        if not method_filter:
+            tmx_results = self.run_tmx_tests()
+            self.test_results.extend(tmx_results)
+            self.failed_tests.extend(r for r in tmx_results if not r["passed"])
+        
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
         
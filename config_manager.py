@@ -8,6 +8,7 @@ class ConfigManager:
     
     def __init__(self, config_name: str = AppConfig.CONFIG_APP_NAME):
         self.config = wx.Config(config_name)
+        self._default_export_dir = os.path.expanduser(AppConfig.DEFAULT_TMX_DIR)
 
     def get_font_size(self, default_size: int = AppConfig.DEFAULT_FONT_SIZE) -> int:
         """Retrieve the font size from the config."""
@@ -21,7 +22,7 @@ class ConfigManager:
     def get_last_export_dir(self, default_dir: Optional[str] = None) -> str:
         """Get the last directory used for TMX export."""
         if default_dir is None:
-            default_dir = os.path.expanduser(AppConfig.DEFAULT_TMX_DIR)
+            default_dir = self._default_export_dir
         return self.config.Read(AppConfig.CONFIG_LAST_EXPORT_DIR_KEY, default_dir)
 
     def set_last_export_dir(self, directory: str) -> None:
@@ -73,6 +74,19 @@ class ConfigManager:
         self.config.Write('LastSelectedMethod', method)
         self.config.Flush()
 
+    def save_session(self, size: Tuple[int, int], position: Tuple[int, int],
+                     language: Optional[str] = None, method: Optional[str] = None) -> None:
+        """Save window state and last selections, flushing to disk only once."""
+        self.config.WriteInt('WindowWidth', size[0])
+        self.config.WriteInt('WindowHeight', size[1])
+        self.config.WriteInt('WindowX', position[0])
+        self.config.WriteInt('WindowY', position[1])
+        if language:
+            self.config.Write('LastSelectedLanguage', language)
+        if method:
+            self.config.Write('LastSelectedMethod', method)
+        self.config.Flush()
+
     # Legacy methods for backward compatibility
     def read_font_size(self, default_size=AppConfig.DEFAULT_FONT_SIZE):
         """Legacy method - use get_font_size instead."""
@@ -9,6 +9,9 @@ class UIStrings:
     SELECT_LANGUAGE = "Select language"
     SELECT_METHOD = "Select method"
     
+    # Combobox values that mean "nothing selected"
+    PLACEHOLDERS = frozenset({SELECT_LANGUAGE, SELECT_METHOD, "", None})
+    
     # Labels
     LANGUAGE_LABEL = "Language:"
     METHOD_LABEL = "Method:"
@@ -2,23 +2,54 @@
 import wx
 import logging
 import os
-from datetime import datetime
-from typing import Optional
+import re
+import time
+from typing import Dict, List, Optional
 from model import XlitToolModel
 from view import XlitToolView
 from tmx_exporter import TMXExporter
-from constants import UIStrings
+from constants import UIStrings, FileConstants
 
 logger = logging.getLogger(__name__)
 
+_NON_SPACE_PATTERN = re.compile(r'\S')
+
+def _has_nonspace(text: Optional[str]) -> bool:
+    """Return True if text contains any non-whitespace character, without copying it."""
+    return bool(text) and _NON_SPACE_PATTERN.search(text) is not None
+
 class XlitToolController:
+    # strftime format for the default TMX filename, resolved once
+    _TMX_NAME_FMT = FileConstants.DEFAULT_TMX_FILENAME_PATTERN.replace('{timestamp}', '%Y%m%d_%H%M%S')
+
     def __init__(self) -> None:
         self._model = XlitToolModel()
         self._view = XlitToolView(self)
         self._tmx_exporter = TMXExporter()
+        
+        # The method registry is static at runtime, so these never need invalidating
+        self._methods_cache: Dict[str, List[str]] = {}
+        self._match_case_cache: Dict[str, bool] = {}
+        
         self._populate_transliteration_methods_in_view()
         self._bind_events()
         
+        # Pre-bind frequently used view methods for the event handlers
+        self._get_input = self._view.get_input_text
+        self._get_output = self._view.get_output_text
+        self._get_language = self._view.get_selected_language
+        self._get_method = self._view.get_selected_method
+        self._get_match_case = self._view.get_match_case
+        self._is_match_case_enabled = self._view.is_match_case_enabled
+        self._set_output = self._view.set_output_text
+        self._set_methods = self._view.set_transliteration_methods
+        self._set_match_case_enabled = self._view.set_match_case_enabled
+        self._show_err = self._view.show_error_dialog
+        self._show_warning = self._view.show_warning_dialog
+        self._show_info = self._view.show_info_dialog
+        self._get_last_export_dir = self._view.config_manager.get_last_export_dir
+        self._set_last_export_dir = self._view.config_manager.set_last_export_dir
+        
         # Restore user's last selections after everything is set up
         self._view.restore_user_selections()
 
@@ -41,70 +72,76 @@ class XlitToolController:
     def _handle_language_change(self, event: wx.CommandEvent) -> None:
         """Handle changes in the language combobox."""
         try:
-            selected_language = self._view.get_selected_language()
+            selected_language = self._get_language()
             
-            if selected_language and selected_language != UIStrings.SELECT_LANGUAGE:
+            if selected_language not in UIStrings.PLACEHOLDERS:
                 # Get methods for the selected language
-                methods = self._model.get_methods_by_language(selected_language)
-                self._view.set_transliteration_methods(methods, self._model)
+                methods = self._methods_cache.get(selected_language)
+                if methods is None:
+                    methods = self._model.get_methods_by_language(selected_language)
+                    self._methods_cache[selected_language] = methods
+                self._set_methods(methods, self._model)
                 
                 # Reset match case checkbox since method hasn't been selected yet
-                self._view.set_match_case_enabled(False)
+                self._set_match_case_enabled(False)
             else:
                 # Clear methods if no language selected
-                self._view.set_transliteration_methods([], self._model)
-                self._view.set_match_case_enabled(False)
+                self._set_methods([], self._model)
+                self._set_match_case_enabled(False)
                 
         except (AttributeError, ValueError) as e:
             logger.error(f"Error handling language change: {e}")
-            self._view.show_error_dialog("An error occurred while updating the interface.")
+            self._show_err("An error occurred while updating the interface.")
         except Exception as e:
             logger.error(f"Unexpected error handling language change: {e}")
-            self._view.show_error_dialog("An unexpected error occurred while updating the interface.")
+            self._show_err("An unexpected error occurred while updating the interface.")
 
     def _handle_combobox_change(self, event: wx.CommandEvent) -> None:
         """Handle changes in the transliteration method combobox."""
         try:
-            method_name = self._view.get_selected_method()
-            enable_match_case = self._model.should_enable_match_case(method_name)
-            self._view.set_match_case_enabled(enable_match_case)
+            method_name = self._get_method()
+            enable_match_case = self._match_case_cache.get(method_name)
+            if enable_match_case is None:
+                enable_match_case = self._model.should_enable_match_case(method_name)
+                self._match_case_cache[method_name] = enable_match_case
+            self._set_match_case_enabled(enable_match_case)
         except (AttributeError, ValueError) as e:
             logger.error(f"Error handling combobox change: {e}")
-            self._view.show_error_dialog("An error occurred while updating the interface.")
+            self._show_err("An error occurred while updating the interface.")
         except Exception as e:
             logger.error(f"Unexpected error handling combobox change: {e}")
-            self._view.show_error_dialog("An unexpected error occurred while updating the interface.")
+            self._show_err("An unexpected error occurred while updating the interface.")
 
     def _handle_tmx(self, event: wx.CommandEvent) -> None:
         """Handle the 'Save to TMX' button click."""
         try:
             # Get current text and method
-            source_text = self._view.get_input_text()
-            target_text = self._view.get_output_text()
-            method_name = self._view.get_selected_method()
+            source_text = self._get_input()
+            target_text = self._get_output()
+            method_name = self._get_method()
             
             # Validate that we have content to export
-            if not source_text or not source_text.strip():
-                self._view.show_warning_dialog(
+            if not _has_nonspace(source_text):
+                self._show_warning(
                     "Please enter some text to transliterate before exporting to TMX.",
                     "No Input Text"
                 )
                 return
                 
-            if not target_text or not target_text.strip():
-                self._view.show_warning_dialog(
+            if not _has_nonspace(target_text):
+                self._show_warning(
                     "Please transliterate the text first before exporting to TMX.",
                     "No Output Text"
                 )
                 return
             
             # Show file dialog to choose save location
-            default_dir = self._view.config_manager.get_last_export_dir()
+            default_dir = self._get_last_export_dir()
             with wx.FileDialog(
                 self._view,
                 UIStrings.TMX_SAVE_DIALOG_TITLE,
                 defaultDir=default_dir,
-                defaultFile=f"transliteration_{datetime.now().strftime('%Y%m%d_%H%M%S')}.tmx",
+                defaultFile=time.strftime(self._TMX_NAME_FMT),
                 wildcard=UIStrings.TMX_FILE_FILTER,
                 style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT
             ) as fileDialog:
@@ -114,9 +151,10 @@ class XlitToolController:
                 
                 # Get the selected file path
                 file_path = fileDialog.GetPath()
+                dir_path = os.path.dirname(file_path)
                 
                 # Save the directory for next time
-                self._view.config_manager.set_last_export_dir(os.path.dirname(file_path))
+                self._set_last_export_dir(dir_path)
                 
                 # Ensure .tmx extension
                 if not file_path.lower().endswith('.tmx'):
@@ -124,7 +162,7 @@ class XlitToolController:
                 
                 # Export to TMX
                 success, exported_path, error_message = self._tmx_exporter.export_transliteration(
-                    source_text, target_text, method_name, os.path.dirname(file_path)
+                    source_text, target_text, method_name, dir_path
                 )
                 
                 if success:
@@ -136,32 +174,32 @@ class XlitToolController:
                         except OSError:
                             pass  # Keep original filename
                     
-                    self._view.show_info_dialog(
+                    self._show_info(
                         f"TMX file exported successfully!\n\nSaved to: {exported_path}",
                         "Export Successful"
                     )
                     logger.info(f"TMX export successful: {exported_path}")
                 else:
-                    self._view.show_error_dialog(
+                    self._show_err(
                         f"Failed to export TMX file:\n{error_message}",
                         "Export Failed"
                     )
                     
         except (OSError, IOError) as e:
             logger.error(f"File system error during TMX export: {e}")
-            self._view.show_error_dialog(
+            self._show_err(
                 "A file system error occurred while exporting to TMX. Please check the save location and permissions.",
                 "Export Error"
             )
         except ValueError as e:
             logger.error(f"Invalid data during TMX export: {e}")
-            self._view.show_error_dialog(
+            self._show_err(
                 "Invalid data detected during TMX export. Please check your input text.",
                 "Export Error"
             )
         except Exception as e:
             logger.error(f"Unexpected error in TMX export handler: {e}")
-            self._view.show_error_dialog(
+            self._show_err(
                 "An unexpected error occurred while exporting to TMX. Please try again.",
                 "Export Error"
             )
@@ -173,48 +211,48 @@ class XlitToolController:
             logger.info("Text fields cleared successfully")
         except AttributeError as e:
             logger.error(f"Interface error clearing text fields: {e}")
-            self._view.show_error_dialog("An interface error occurred while clearing the text fields.")
+            self._show_err("An interface error occurred while clearing the text fields.")
         except Exception as e:
             logger.error(f"Unexpected error clearing text fields: {e}")
-            self._view.show_error_dialog("An unexpected error occurred while clearing the text fields.")
+            self._show_err("An unexpected error occurred while clearing the text fields.")
 
     def _handle_transliteration(self, event: wx.CommandEvent) -> None:
         """Perform transliteration based on the selected method and input text."""
         try:
             # Get input parameters
-            method_name = self._view.get_selected_method()
-            text = self._view.get_input_text()
-            match_case = self._view.get_match_case() and self._view.is_match_case_enabled()
+            method_name = self._get_method()
+            text = self._get_input()
+            match_case = self._get_match_case() and self._is_match_case_enabled()
 
             # Perform transliteration with error handling
             success, result, error_message, warnings = self._model.transliterate(method_name, text, match_case)
             
             if success:
-                self._view.set_output_text(result)
+                self._set_output(result)
                 logger.info(f"Transliteration completed successfully: {len(text)} -> {len(result)} characters")
                 
                 # Show warnings if any
                 if warnings:
                     warning_msg = "Transliteration completed with the following warnings:\n\n" + "\n".join(f"• {w}" for w in warnings)
-                    self._view.show_warning_dialog(warning_msg, "Transliteration Warnings")
+                    self._show_warning(warning_msg, "Transliteration Warnings")
             else:
                 # Show user-friendly error message
-                self._view.show_error_dialog(error_message, "Transliteration Error")
+                self._show_err(error_message, "Transliteration Error")
                 # Clear output on error
-                self._view.set_output_text("")
+                self._set_output("")
                 
         except (AttributeError, ValueError) as e:
             logger.error(f"Interface or data error in transliteration handler: {e}")
-            self._view.show_error_dialog(
+            self._show_err(
                 "An interface or data error occurred. Please check your input and try again.",
                 "Transliteration Error"
             )
-            self._view.set_output_text("")
+            self._set_output("")
         except Exception as e:
             logger.error(f"Unexpected error in transliteration handler: {e}")
-            self._view.show_error_dialog(
+            self._show_err(
                 "An unexpected error occurred. Please try again or contact support if the problem persists.",
                 "Unexpected Error"
             )
-            self._view.set_output_text("")
+            self._set_output("")
 
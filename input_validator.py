@@ -7,6 +7,7 @@ import re
 import unicodedata
 import logging
 from method_registry import get_method_registry
+from constants import UIStrings
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,15 @@ class InputValidator:
         self.compiled_patterns = [re.compile(pattern, re.IGNORECASE | re.DOTALL) 
                                 for pattern in self.DANGEROUS_PATTERNS]
         
+        # Whitespace cleanup patterns used by sanitize_text. The lookbehind makes
+        # trailing-whitespace matches start only at the beginning of a run.
+        self.trailing_space_pattern = re.compile(r'(?<![^\S\n])[^\S\n]+(?=\n|\Z)')
+        self.blank_lines_pattern = re.compile(r'\n{4,}')
+        self.whitespace_pattern = re.compile(r'\s+')
+        
+        # Matches the start of any line longer than MAX_LINE_LENGTH
+        self.long_line_pattern = re.compile(r'^[^\n]{%d}' % (self.MAX_LINE_LENGTH + 1), re.MULTILINE)
+        
         # Get valid methods from registry
         self.registry = get_method_registry()
         self.VALID_METHODS = self.registry.get_valid_method_names()
@@ -57,18 +67,29 @@ class InputValidator:
             errors.append(f"Text exceeds maximum length of {self.MAX_TEXT_LENGTH:,} characters")
         
         # Check line count
-        lines = text.split('\n')
-        if len(lines) > self.MAX_LINES:
+        if text.count('\n') + 1 > self.MAX_LINES:
             errors.append(f"Text exceeds maximum of {self.MAX_LINES:,} lines")
         
-        # Check individual line lengths
-        long_lines = [i+1 for i, line in enumerate(lines) if len(line) > self.MAX_LINE_LENGTH]
-        if long_lines:
-            if len(long_lines) <= 3:
-                line_list = ", ".join(map(str, long_lines))
-                errors.append(f"Lines {line_list} exceed maximum length of {self.MAX_LINE_LENGTH:,} characters")
-            else:
-                errors.append(f"{len(long_lines)} lines exceed maximum length of {self.MAX_LINE_LENGTH:,} characters")
+        # Check individual line lengths (no line can be too long if the whole text isn't)
+        if len(text) > self.MAX_LINE_LENGTH:
+            matches = self.long_line_pattern.finditer(text)
+            long_lines = []
+            line_number, position = 1, 0
+            for match in matches:
+                line_number += text.count('\n', position, match.start())
+                position = match.start()
+                long_lines.append(line_number)
+                if len(long_lines) > 3:
+                    break
+            
+            if long_lines:
+                if len(long_lines) <= 3:
+                    line_list = ", ".join(map(str, long_lines))
+                    errors.append(f"Lines {line_list} exceed maximum length of {self.MAX_LINE_LENGTH:,} characters")
+                else:
+                    # Only the total matters past three offenders
+                    long_count = len(long_lines) + sum(1 for _ in matches)
+                    errors.append(f"{long_count} lines exceed maximum length of {self.MAX_LINE_LENGTH:,} characters")
         
         return len(errors) == 0, errors
     
@@ -88,7 +109,7 @@ class InputValidator:
             errors.append("Please select a transliteration method")
             return False, errors
         
-        if method_name == "Select method":
+        if method_name in UIStrings.PLACEHOLDERS:
             errors.append("Please select a valid transliteration method")
             return False, errors
         
@@ -151,20 +172,58 @@ class InputValidator:
         
         # Remove excessive whitespace while preserving intentional formatting
         if preserve_formatting:
-            # Remove trailing/leading whitespace from each line
-            lines = text.split('\n')
-            lines = [line.rstrip() for line in lines]
-            text = '\n'.join(lines)
+            # Remove trailing whitespace from each line
+            text = self.trailing_space_pattern.sub('', text)
             
             # Remove excessive consecutive empty lines (max 2)
-            text = re.sub(r'\n{4,}', '\n\n\n', text)
+            text = self.blank_lines_pattern.sub('\n\n\n', text)
         else:
             # Normalize all whitespace to single spaces
-            text = re.sub(r'\s+', ' ', text).strip()
+            text = self.whitespace_pattern.sub(' ', text).strip()
         
         return text
     
-    def validate_and_sanitize_input(self, text, method_name, sanitize=True):
+    def validate_and_sanitize_text(self, text, sanitize=True):
+        """
+        Validate and sanitize input text. Does not depend on the method, so
+        callers may reuse the outcome when only the method changes.
+        
+        Args:
+            text (str): Input text to validate and sanitize (not None)
+            sanitize (bool): Whether to sanitize the text
+            
+        Returns:
+            tuple: (is_valid: bool, sanitized_text: str, errors: list, warnings: list)
+        """
+        is_valid = True
+        sanitized_text = text
+        errors = []
+        warnings = []
+        
+        # Sanitize text if requested
+        if sanitize:
+            original_length = len(text)
+            sanitized_text = self.sanitize_text(text)
+            
+            # Warn if sanitization changed the text significantly
+            if len(sanitized_text) < original_length * 0.95:
+                warnings.append("Text was modified during sanitization (potentially unsafe content removed)")
+        
+        # Validate text length
+        length_valid, length_errors = self.validate_text_length(sanitized_text)
+        if not length_valid:
+            errors.extend(length_errors)
+            is_valid = False
+        
+        # Check for dangerous content
+        has_dangerous, dangerous_patterns = self.detect_dangerous_content(sanitized_text)
+        if has_dangerous:
+            warnings.append(f"Potentially unsafe content detected: {', '.join(dangerous_patterns)}")
+            logger.warning(f"Dangerous content detected in input: {dangerous_patterns}")
+        
+        return is_valid, sanitized_text, errors, warnings
+    
+    def validate_and_sanitize_input(self, text, method_name, sanitize=True, text_result=None):
         """
         Comprehensive validation and sanitization of user input.
         
@@ -172,6 +231,8 @@ class InputValidator:
             text (str): Input text to validate and sanitize
             method_name (str): Transliteration method name
             sanitize (bool): Whether to sanitize the text
+            text_result (tuple): Outcome of validate_and_sanitize_text for this
+                text and sanitize flag, if the caller already has it
             
         Returns:
             dict: {
@@ -200,6 +261,18 @@ class InputValidator:
             result['is_valid'] = False
             return result
         
+        # Sanitize and validate the text itself
+        if text_result is None:
+            text_result = self.validate_and_sanitize_text(text, sanitize)
+        text_valid, result['sanitized_text'], text_errors, text_warnings = text_result
+        result['errors'].extend(text_errors)
+        result['warnings'].extend(text_warnings)
+        if not text_valid:
+            result['is_valid'] = False
+        
+        return result
+    
+        
         # Sanitize text if requested
         if sanitize:
             original_length = len(text)
@@ -4,13 +4,18 @@ Single source of truth for all method discovery, organization, and metadata.
 """
 
 import importlib
+import importlib.util
 import logging
 import re
-from typing import Dict, List, Set, Optional, Any
+import threading
+from typing import Dict, List, Set, Optional, Any, Tuple
 from constants import UIStrings
 
 logger = logging.getLogger(__name__)
 
+# Trailing parenthesised part of "Language (Script)-->Target (Method)"
+_DISPLAY_NAME_PATTERN = re.compile(r'\(([^)]+)\)$')
+
 
 class MethodRegistry:
     """
@@ -18,18 +23,22 @@ class MethodRegistry:
     and provides metadata about them.
     """
     
+    __slots__ = ('_methods', '_language_groups', '_display_names', '_reverse_display_names',
+                 '_no_case_match', '_method_to_language')
+    
     def __init__(self):
-        self._methods: Dict[str, Any] = {}
+        self._methods: Dict[str, Any] = {}  # Module name until first use, then the module (None if it failed to load)
         self._language_groups: Dict[str, List[str]] = {}
         self._display_names: Dict[str, str] = {}
+        self._reverse_display_names: Dict[Tuple[str, str], str] = {}
         self._no_case_match: Set[str] = set()
         self._method_to_language: Dict[str, str] = {}
         
         self._discover_methods()
         self._organize_by_language()
         self._generate_display_names()
+        self._build_reverse_display_names()
         self._identify_no_case_methods()
-        self._generate_language_codes()
         
         # Validate the registry
         self._validate_registry()
@@ -50,14 +59,14 @@ class MethodRegistry:
             ]
             method_modules.extend(additional_methods)
             
+            # Only record module names here; modules are imported lazily by get_method
             for module_name in method_modules:
-                try:
-                    module = importlib.import_module(f'transliteration_methods.{module_name}')
-                    method_full_name = self._module_to_method_name(module_name)
-                    self._methods[method_full_name] = module
-                    logger.debug(f"Discovered method: {method_full_name}")
-                except ImportError as e:
-                    logger.warning(f"Could not import method module {module_name}: {e}")
+                if importlib.util.find_spec(f'transliteration_methods.{module_name}') is None:
+                    logger.warning(f"Could not find method module {module_name}")
+                    continue
+                method_full_name = self._module_to_method_name(module_name)
+                self._methods[method_full_name] = module_name
+                logger.debug(f"Discovered method: {method_full_name}")
                     
         except ImportError as e:
             logger.error(f"Could not import transliteration_methods package: {e}")
@@ -97,33 +106,36 @@ class MethodRegistry:
         return module_mapping.get(module_name, module_name)
     
     def _organize_by_language(self) -> None:
-        """Organize methods by language."""
-        language_patterns = {
-            'Azerbaijani': r'Azeri.*',
-            'Belarusian': r'Belarussian.*',
-            'Bulgarian': r'Bulgarian.*',
-            'Georgian': r'Georgian.*',
-            'Kazakh': r'Kazakh.*',
-            'Kyrgyz': r'Kyrghyz.*',
-            'Macedonian': r'Macedonian.*',
-            'Mongolian': r'Mongolian.*',
-            'Russian': r'Russian.*',
-            'Serbian': r'Serbian.*',
-            'Tajik': r'Tajik.*',
-            'Tatar': r'Tatar.*',
-            'Turkmen': r'Turkmen.*',
-            'Ukrainian': r'Ukrainian.*',
-            'Uyghur': r'Uyghur.*',
-            'Uzbek': r'Uzbek.*',
+        """Organize methods by language and record their language codes for TMX export."""
+        # Every method name starts with its language, so dispatch on the first word
+        languages_by_prefix = {
+            'Azeri': ('Azerbaijani', 'az'),
+            'Belarussian': ('Belarusian', 'be'),
+            'Bulgarian': ('Bulgarian', 'bg'),
+            'Georgian': ('Georgian', 'ka'),
+            'Kazakh': ('Kazakh', 'kk'),
+            'Kyrghyz': ('Kyrgyz', 'ky'),
+            'Macedonian': ('Macedonian', 'mk'),
+            'Mongolian': ('Mongolian', 'mn'),
+            'Russian': ('Russian', 'ru'),
+            'Serbian': ('Serbian', 'sr'),
+            'Tajik': ('Tajik', 'tg'),
+            'Tatar': ('Tatar', 'tt'),
+            'Turkmen': ('Turkmen', 'tk'),
+            'Ukrainian': ('Ukrainian', 'uk'),
+            'Uyghur': ('Uyghur', 'ug'),
+            'Uzbek': ('Uzbek', 'uz'),
         }
         
-        for language, pattern in language_patterns.items():
-            matching_methods = [
-                method for method in self._methods.keys()
-                if re.match(pattern, method)
-            ]
-            if matching_methods:
-                self._language_groups[language] = sorted(matching_methods)
+        for method in self._methods:
+            entry = languages_by_prefix.get(method.split(' ', 1)[0])
+            if entry:
+                language, code = entry
+                self._language_groups.setdefault(language, []).append(method)
+                self._method_to_language[method] = code
+        
+        for methods in self._language_groups.values():
+            methods.sort()
     
     def _generate_display_names(self) -> None:
         """Generate display names for methods with special cases."""
@@ -140,7 +152,7 @@ class MethodRegistry:
             else:
                 # Extract method name from the full name
                 # Pattern: "Language (Script)-->Target (Method)"
-                match = re.search(r'\(([^)]+)\)$', method_name)
+                match = _DISPLAY_NAME_PATTERN.search(method_name)
                 if match:
                     self._display_names[method_name] = match.group(1)
                 else:
@@ -151,6 +163,13 @@ class MethodRegistry:
                     else:
                         self._display_names[method_name] = method_name
     
+    def _build_reverse_display_names(self) -> None:
+        """Map (language, display name) back to the full method name."""
+        for language, methods in self._language_groups.items():
+            for method in methods:
+                # Keep the first match, as a scan of the sorted group would
+                self._reverse_display_names.setdefault((language, self._display_names[method]), method)
+    
     def _identify_no_case_methods(self) -> None:
         """Identify methods that don't support case matching."""
         no_case_methods = {
@@ -166,21 +185,6 @@ class MethodRegistry:
             if method in self._methods
         }
     
-    def _generate_language_codes(self) -> None:
-        """Generate language codes for TMX export."""
-        language_code_mapping = {
-            'Azeri': 'az', 'Belarussian': 'be', 'Bulgarian': 'bg', 'Georgian': 'ka',
-            'Kazakh': 'kk', 'Kyrghyz': 'ky', 'Macedonian': 'mk', 'Mongolian': 'mn',
-            'Russian': 'ru', 'Serbian': 'sr', 'Tajik': 'tg', 'Tatar': 'tt',
-            'Turkmen': 'tk', 'Ukrainian': 'uk', 'Uyghur': 'ug', 'Uzbek': 'uz'
-        }
-        
-        for method_name in self._methods.keys():
-            for language_name, code in language_code_mapping.items():
-                if method_name.startswith(language_name):
-                    self._method_to_language[method_name] = code
-                    break
-    
     def _validate_registry(self) -> None:
         """Validate that the registry is properly configured."""
         errors = []
@@ -211,12 +215,39 @@ class MethodRegistry:
     # Public interface methods
     
     def get_all_methods(self) -> Dict[str, Any]:
-        """Get all methods dictionary."""
-        return self._methods.copy()
+        """Get all methods dictionary (imports any methods not yet loaded).
+        Methods whose module failed to load are left out."""
+        methods = {}
+        for method_name in self._methods:
+            method = self.get_method(method_name)
+            if method is not None:
+                methods[method_name] = method
+        return methods
     
     def get_method(self, method_name: str) -> Optional[Any]:
-        """Get a specific method module."""
-        return self._methods.get(method_name)
+        """Get a specific method module, importing it on first use.
+        Returns None for unknown methods and for modules that failed to load."""
+        method = self._methods.get(method_name)
+        if isinstance(method, str):
+            module_name = method
+            try:
+                method = importlib.import_module(f'transliteration_methods.{module_name}')
+            except Exception as e:
+                # Syntax errors and bad dependencies surface here, not at discovery
+                logger.warning(f"Could not import method module {module_name}: {e}")
+                method = None
+            else:
+                # Checked once here so callers can use method.transliterate unguarded
+                if not callable(getattr(method, 'transliterate', None)):
+                    logger.warning(f"Method module {module_name} has no callable 'transliterate'")
+                    method = None
+            # Record the outcome either way so a broken module is not re-imported on every call
+            self._methods[method_name] = method
+        return method
+    
+    def is_registered(self, method_name: str) -> bool:
+        """Check whether a method was discovered, whether or not it loads."""
+        return method_name in self._methods
     
     def get_method_names(self) -> List[str]:
         """Get list of all method names."""
@@ -236,11 +267,7 @@ class MethodRegistry:
     
     def get_method_from_display_name(self, display_name: str, language: str) -> str:
         """Get full method name from display name within a language context."""
-        if language in self._language_groups:
-            for method in self._language_groups[language]:
-                if self.get_display_name(method) == display_name:
-                    return method
-        return display_name
+        return self._reverse_display_names.get((language, display_name), display_name)
     
     def should_enable_case_match(self, method_name: str) -> bool:
         """Check if a method supports case matching."""
@@ -257,11 +284,15 @@ class MethodRegistry:
 
 # Global registry instance
 _registry_instance: Optional[MethodRegistry] = None
+_registry_lock = threading.Lock()
 
 
 def get_method_registry() -> MethodRegistry:
-    """Get the global method registry instance (singleton pattern)."""
+    """Get the global method registry instance (thread-safe singleton)."""
     global _registry_instance
     if _registry_instance is None:
-        _registry_instance = MethodRegistry()
+        with _registry_lock:
+            # Re-check: another thread may have built it while we waited
+            if _registry_instance is None:
+                _registry_instance = MethodRegistry()
     return _registry_instance
\ No newline at end of file
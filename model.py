@@ -1,10 +1,12 @@
 # model.py
 
 import logging
+from collections import OrderedDict
 from typing import Tuple, List, Dict, Any
 from transliteration_methods import utils
 from input_validator import InputValidator
 from method_registry import get_method_registry
+from constants import UIStrings
 
 logger = logging.getLogger(__name__)
 
@@ -13,12 +15,24 @@ class XlitToolError(Exception):
     pass
 
 class XlitToolModel:
+    __slots__ = ('validator', 'registry', '_last_text_key', '_last_text_result', '_cache')
+
+    # Bounds for the transliteration result cache
+    _CACHE_SIZE = 128
+    _CACHE_MAX_TEXT_LENGTH = 100_000
+
     def __init__(self):
         self.validator = InputValidator()
         self.registry = get_method_registry()
         
-        # For backward compatibility, expose methods as property
-        self.methods = self.registry.get_all_methods()
+        # Most recent text-only validation, reused when the same text is
+        # transliterated with another method (the result cache below is keyed
+        # on the method, so it does not cover switching methods)
+        self._last_text_key = None
+        self._last_text_result = None
+        
+        # Recent successful results, most recently used last
+        self._cache: OrderedDict = OrderedDict()
 
 
     def get_languages(self) -> List[str]:
@@ -27,7 +41,7 @@ class XlitToolModel:
 
     def get_transliteration_methods(self) -> List[str]:
         """Return all transliteration methods (legacy method for backward compatibility)."""
-        return ["Select method"] + list(self.methods.keys())
+        return [UIStrings.SELECT_METHOD] + self.registry.get_method_names()
 
     def get_methods_by_language(self, language: str) -> List[str]:
         """Return transliteration methods for a specific language."""
@@ -54,7 +68,20 @@ class XlitToolModel:
         Returns:
             Validation result with sanitized text, errors, and warnings
         """
-        return self.validator.validate_and_sanitize_input(text, method_name, sanitize)
+        if not isinstance(text, str):
+            return self.validator.validate_and_sanitize_input(text, method_name, sanitize)
+        
+        # Sanitizing and checking the text does not depend on the method, so
+        # only validate_method_name runs again when just the method changes
+        key = (sanitize, text)
+        if key != self._last_text_key:
+            self._last_text_result = self.validator.validate_and_sanitize_text(text, sanitize)
+            self._last_text_key = key
+        
+        # The validator builds fresh error/warning lists from the memo's, so
+        # callers can't alter the stored result
+        return self.validator.validate_and_sanitize_input(text, method_name, sanitize,
+                                                          text_result=self._last_text_result)
 
     def transliterate(self, method_name: str, text: str, match_case: bool, sanitize_input: bool = True) -> Tuple[bool, str, str, List[str]]:
         """
@@ -69,6 +96,32 @@ class XlitToolModel:
         Returns:
             Tuple of (success, result, error_message, warnings)
         """
+        # Only plain str/bool arguments form the cache key; anything else (e.g.
+        # an unhashable method name) goes straight to _transliterate, which
+        # reports it as a failed result instead of raising
+        cacheable = (isinstance(method_name, str) and isinstance(text, str)
+                     and isinstance(match_case, bool) and isinstance(sanitize_input, bool)
+                     and len(text) <= self._CACHE_MAX_TEXT_LENGTH)
+        if cacheable:
+            key = (method_name, match_case, sanitize_input, text)
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                success, result, error_message, warnings = cached
+                return success, result, error_message, list(warnings)
+        
+        outcome = self._transliterate(method_name, text, match_case, sanitize_input)
+        
+        if cacheable and outcome[0]:
+            self._cache[key] = outcome
+            if len(self._cache) > self._CACHE_SIZE:
+                self._cache.popitem(last=False)
+            success, result, error_message, warnings = outcome
+            return success, result, error_message, list(warnings)
+        return outcome
+
+    def _transliterate(self, method_name: str, text: str, match_case: bool, sanitize_input: bool) -> Tuple[bool, str, str, List[str]]:
+        """Run validation and transliteration without consulting the result cache."""
         try:
             # Validate and sanitize inputs
             validation_result = self.validate_and_sanitize_input(method_name, text, sanitize_input)
@@ -82,9 +135,12 @@ class XlitToolModel:
             sanitized_text = validation_result['sanitized_text']
             warnings = validation_result['warnings']
             
-            method = self.methods.get(method_name)
+            method = self.registry.get_method(method_name)
             if not method:
-                error_msg = f"Transliteration method '{method_name}' not found"
+                if self.registry.is_registered(method_name):
+                    error_msg = f"Transliteration method '{method_name}' could not be loaded"
+                else:
+                    error_msg = f"Transliteration method '{method_name}' not found"
                 logger.error(error_msg)
                 return False, "", error_msg, warnings
 
@@ -4,13 +4,21 @@ TMX is a standard format for exchanging translation memories between different t
 """
 
 import os
+import string
 import xml.etree.ElementTree as ET
+from itertools import chain, zip_longest
 from datetime import datetime
 import logging
 from method_registry import get_method_registry
 
 logger = logging.getLogger(__name__)
 
+# Write buffer size for TMX files, batching the serializer's many small writes
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Characters allowed to carry over from a method name into an export filename
+_SAFE_FILENAME_CHARS = frozenset(string.ascii_letters + string.digits + ' _-')
+
 class TMXExporter:
     """Handle TMX file creation and export."""
     
@@ -22,73 +30,104 @@ class TMXExporter:
         # Get language mapping from registry
         self.registry = get_method_registry()
     
-    def create_tmx_document(self, source_text, target_text, source_lang=None, target_lang="en", method_name=""):
+    def _now_tmx_stamp(self):
+        """Return the current time formatted for the TMX creationdate attribute."""
+        return datetime.now().strftime("%Y%m%dT%H%M%SZ")
+    
+    def _create_header(self, source_lang, method_name=""):
         """
-        Create a TMX document with the given source and target text.
+        Create the TMX <header> element.
         
         Args:
-            source_text (str): Original text
-            target_text (str): Transliterated text
-            source_lang (str): Source language code (auto-detected or specified)
-            target_lang (str): Target language code
+            source_lang (str): Source language code
             method_name (str): Name of transliteration method used
             
         Returns:
-            ET.Element: Root element of TMX document
+            ET.Element: Header element
         """
-        # Infer source language from method name if not provided
-        if source_lang is None:
-            source_lang = self.registry.get_language_code(method_name)
-        
-        # Create root TMX element
-        tmx = ET.Element("tmx")
-        tmx.set("version", self.tmx_version)
-        
-        # Create header
-        header = ET.SubElement(tmx, "header")
-        header.set("creationtool", self.creation_tool)
-        header.set("creationtoolversion", self.creation_tool_version)
-        header.set("datatype", "PlainText")
-        header.set("segtype", "sentence")
-        header.set("adminlang", "en")
-        header.set("srclang", source_lang)
-        header.set("o-tmf", self.creation_tool)
-        header.set("creationdate", datetime.now().strftime("%Y%m%dT%H%M%SZ"))
+        header = ET.Element("header", {
+            "creationtool": self.creation_tool,
+            "creationtoolversion": self.creation_tool_version,
+            "datatype": "PlainText",
+            "segtype": "sentence",
+            "adminlang": "en",
+            "srclang": source_lang,
+            "o-tmf": self.creation_tool,
+            "creationdate": self._now_tmx_stamp(),
+        })
         
         # Add notes about the transliteration method
         if method_name:
             note = ET.SubElement(header, "note")
             note.text = f"Transliteration method: {method_name}"
         
-        # Create body
-        body = ET.SubElement(tmx, "body")
+        return header
+    
+    def _iter_translation_units(self, source_text, target_text, source_lang, target_lang):
+        """
+        Generate one <tu> element per non-empty pair of source/target lines.
         
-        # Split text into lines for individual translation units
+        Args:
+            source_text (str): Original text
+            target_text (str): Transliterated text
+            source_lang (str): Source language code
+            target_lang (str): Target language code
+            
+        Yields:
+            ET.Element: Translation unit element
+        """
+        # Split text into lines for individual translation units. Only '\n'
+        # separates lines: splitlines() would also split on characters such as
+        # '\x0b' (Word's manual line break) that the sanitizer removes from the
+        # target but not from the source, misaligning the pairs. A '\r' left
+        # by CRLF endings is removed by the per-line strip below.
         source_lines = source_text.strip().split('\n')
         target_lines = target_text.strip().split('\n')
         
-        # Ensure we have the same number of lines
-        max_lines = max(len(source_lines), len(target_lines))
-        source_lines.extend([''] * (max_lines - len(source_lines)))
-        target_lines.extend([''] * (max_lines - len(target_lines)))
-        
-        # Create translation units
-        for i, (src_line, tgt_line) in enumerate(zip(source_lines, target_lines)):
-            if src_line.strip() or tgt_line.strip():  # Only add non-empty lines
-                tu = ET.SubElement(body, "tu")
-                tu.set("tuid", f"tu_{i+1}")
+        # Pair the lines up, padding the shorter side with empty lines
+        for i, (src_line, tgt_line) in enumerate(zip_longest(source_lines, target_lines, fillvalue=''), 1):
+            src_line = src_line.strip()
+            tgt_line = tgt_line.strip()
+            if src_line or tgt_line:  # Only add non-empty lines
+                tu = ET.Element("tu", {"tuid": f"tu_{i}"})
                 
                 # Source translation unit variant
-                tuv_src = ET.SubElement(tu, "tuv")
-                tuv_src.set("xml:lang", source_lang)
+                tuv_src = ET.SubElement(tu, "tuv", {"xml:lang": source_lang})
                 seg_src = ET.SubElement(tuv_src, "seg")
-                seg_src.text = src_line.strip()
+                seg_src.text = src_line
                 
                 # Target translation unit variant
-                tuv_tgt = ET.SubElement(tu, "tuv")
-                tuv_tgt.set("xml:lang", target_lang)
+                tuv_tgt = ET.SubElement(tu, "tuv", {"xml:lang": target_lang})
                 seg_tgt = ET.SubElement(tuv_tgt, "seg")
-                seg_tgt.text = tgt_line.strip()
+                seg_tgt.text = tgt_line
+                
+                yield tu
+    
+    def create_tmx_document(self, source_text, target_text, source_lang=None, target_lang="en", method_name=""):
+        """
+        Create a TMX document with the given source and target text.
+        
+        Args:
+            source_text (str): Original text
+            target_text (str): Transliterated text
+            source_lang (str): Source language code (auto-detected or specified)
+            target_lang (str): Target language code
+            method_name (str): Name of transliteration method used
+            
+        Returns:
+            ET.Element: Root element of TMX document
+        """
+        # Infer source language from method name if not provided
+        if source_lang is None:
+            source_lang = self.registry.get_language_code(method_name)
+        
+        # Create root TMX element
+        tmx = ET.Element("tmx", {"version": self.tmx_version})
+        tmx.append(self._create_header(source_lang, method_name))
+        
+        # Create body with translation units
+        body = ET.SubElement(tmx, "body")
+        body.extend(self._iter_translation_units(source_text, target_text, source_lang, target_lang))
         
         return tmx
     
@@ -108,13 +147,23 @@ class TMXExporter:
             if level and (not elem.tail or not elem.tail.strip()):
                 elem.tail = indent
     
-    def export_to_file(self, tmx_root, file_path):
+    def _indent_element(self, elem, level):
+        """Indent a detached element as if it sat at the given depth, leaving its tail unset."""
+        try:
+            ET.indent(elem, space="  ", level=level)  # Python 3.9+
+        except AttributeError:
+            # Fallback for older Python versions
+            self._indent_xml(elem, level)
+            elem.tail = None
+    
+    def export_to_file(self, tmx_root, file_path, pretty=False):
         """
         Export TMX document to file.
         
         Args:
             tmx_root (ET.Element): TMX root element
             file_path (str): Path to save the TMX file
+            pretty (bool): Whether to indent the XML for human inspection
             
         Returns:
             tuple: (success: bool, error_message: str)
@@ -127,14 +176,15 @@ class TMXExporter:
             tree = ET.ElementTree(tmx_root)
             
             # Pretty print (try modern method first, fallback for older Python)
-            try:
-                ET.indent(tree, space="  ", level=0)  # Python 3.9+
-            except AttributeError:
-                # Fallback for older Python versions
-                self._indent_xml(tmx_root)
+            if pretty:
+                try:
+                    ET.indent(tree, space="  ", level=0)  # Python 3.9+
+                except AttributeError:
+                    # Fallback for older Python versions
+                    self._indent_xml(tmx_root)
             
             # Write XML declaration and TMX content
-            with open(file_path, 'wb') as f:
+            with open(file_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
                 f.write(b'<?xml version="1.0" encoding="UTF-8"?>\n')
                 f.write(b'<!DOCTYPE tmx SYSTEM "tmx14.dtd">\n')
                 tree.write(f, encoding='utf-8', xml_declaration=False)
@@ -155,6 +205,79 @@ class TMXExporter:
             logger.error(error_msg)
             return False, error_msg
     
+    def write_tmx_file(self, source_text, target_text, file_path, source_lang=None, target_lang="en", method_name="", pretty=False):
+        """
+        Write a TMX document straight to file, one translation unit at a time.
+        
+        Produces the same output as create_tmx_document followed by
+        export_to_file, but never holds more than one <tu> element in memory.
+        
+        Args:
+            source_text (str): Original text
+            target_text (str): Transliterated text
+            file_path (str): Path to save the TMX file
+            source_lang (str): Source language code (auto-detected or specified)
+            target_lang (str): Target language code
+            method_name (str): Name of transliteration method used
+            pretty (bool): Whether to indent the XML for human inspection
+            
+        Returns:
+            tuple: (success: bool, error_message: str)
+        """
+        try:
+            # Infer source language from method name if not provided
+            if source_lang is None:
+                source_lang = self.registry.get_language_code(method_name)
+            
+            # Create the directory if it doesn't exist
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            
+            # Whitespace written between elements (none unless pretty printing)
+            outer_indent, unit_indent = ("\n  ", "\n    ") if pretty else ("", "")
+            
+            header = self._create_header(source_lang, method_name)
+            if pretty:
+                self._indent_element(header, 1)
+            header.tail = outer_indent
+            
+            units = self._iter_translation_units(source_text, target_text, source_lang, target_lang)
+            first_unit = next(units, None)
+            
+            with open(file_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(b'<?xml version="1.0" encoding="UTF-8"?>\n')
+                f.write(b'<!DOCTYPE tmx SYSTEM "tmx14.dtd">\n')
+                f.write(f'<tmx version="{self.tmx_version}">{outer_indent}'.encode('utf-8'))
+                f.write(ET.tostring(header, encoding='utf-8'))
+                
+                if first_unit is None:
+                    f.write(b'<body />')
+                else:
+                    f.write(b'<body>')
+                    unit_indent = unit_indent.encode('utf-8')
+                    for tu in chain((first_unit,), units):
+                        if pretty:
+                            self._indent_element(tu, 2)
+                        f.write(unit_indent)
+                        f.write(ET.tostring(tu, encoding='utf-8'))
+                    f.write(f'{outer_indent}</body>'.encode('utf-8'))
+                f.write(b'\n</tmx>' if pretty else b'</tmx>')
+            
+            logger.info(f"TMX file exported successfully to: {file_path}")
+            return True, ""
+            
+        except PermissionError:
+            error_msg = f"Permission denied: Cannot write to {file_path}"
+            logger.error(error_msg)
+            return False, error_msg
+        except OSError as e:
+            error_msg = f"File system error: {e}"
+            logger.error(error_msg)
+            return False, error_msg
+        except Exception as e:
+            error_msg = f"Unexpected error during TMX export: {e}"
+            logger.error(error_msg)
+            return False, error_msg
+    
     def export_transliteration(self, source_text, target_text, method_name="", output_dir=None):
         """
         Complete TMX export process for transliteration data.
@@ -181,16 +304,13 @@ class TMXExporter:
             
             # Generate filename with timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_method_name = "".join(c for c in method_name if c.isalnum() or c in (' ', '_', '-')).strip()
-            safe_method_name = safe_method_name.replace(' ', '_')
+            safe_method_name = "".join(c for c in method_name if c in _SAFE_FILENAME_CHARS)
+            safe_method_name = safe_method_name.strip().replace(' ', '_')
             filename = f"transliteration_{safe_method_name}_{timestamp}.tmx"
             file_path = os.path.join(output_dir, filename)
             
-            # Create TMX document
-            tmx_root = self.create_tmx_document(source_text, target_text, method_name=method_name)
-            
-            # Export to file
-            success, error = self.export_to_file(tmx_root, file_path)
+            # Stream the TMX document to file
+            success, error = self.write_tmx_file(source_text, target_text, file_path, method_name=method_name)
             
             if success:
                 return True, file_path, ""
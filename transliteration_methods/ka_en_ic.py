@@ -1,5 +1,4 @@
 # ka_en_ic.py
-from .utils import apply_replacements
 
 char_map = {
     "ა": "a",
@@ -37,7 +36,13 @@ char_map = {
     "ჰ": "h",
 }
 
+# Precomputed once at import; keep out of transliterate() so it is not rebuilt per call.
+_TRANS_TABLE = str.maketrans(char_map)
+
 def transliterate(src_text: str) -> str:
     """Return transliterated string"""
-    src_text = apply_replacements(src_text, char_map)
+    src_text = src_text.translate(_TRANS_TABLE)
+    # Georgian is unicameral, so every word is capitalised in the output
+    # ("ჟ ღ" -> "Zh Gh"). Capitalising only the first letter would change
+    # that. For short inputs this final .title() pass is the main cost.
     return src_text.title()
\ No newline at end of file
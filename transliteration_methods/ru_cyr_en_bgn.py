@@ -1,13 +1,15 @@
 # ru_cyr_en_bgn.py
 import re
-from .utils import apply_replacements, apply_regex_replacements
 
-regex_patterns = (
-    (re.compile(r"([бвгджзклмнпрстфхцчшщБВГДЖЗКЛМНПРСТФХЦЧШЩ])е"), r"\1e"),
-    (re.compile(r"([бвгджзклмнпрстфхцчшщБВГДЖЗКЛМНПРСТФХЦЧШЩ])Е"), r"\1E"),
-    (re.compile(r"([бвгджзклмнпрстфхцчшщБВГДЖЗКЛМНПРСТФХЦЧШЩ])ё"), r"\1ë"),
-    (re.compile(r"([бвгджзклмнпрстфхцчшщБВГДЖЗКЛМНПРСТФХЦЧШЩ])Ё"), r"\1Ë"),
-)
+# To handle the cases where [ЕеЁё] after a consonant do NOT convert with a
+# preceding y. One pass over the text instead of one pass per vowel.
+consonant_vowel_pattern = re.compile(r"(?<=[бвгджзклмнпрстфхцчшщБВГДЖЗКЛМНПРСТФХЦЧШЩ])[еЕёЁ]")
+consonant_vowel_map = {
+    'е': 'e',
+    'Е': 'E',
+    'ё': 'ë',
+    'Ё': 'Ë',
+}
 
 # Do replacements after handling regex replacements
 char_map = {
@@ -79,8 +81,11 @@ char_map = {
     'Я': 'Ya'
 }
 
+# Precomputed once at import; keep out of transliterate() so it is not rebuilt per call.
+_TRANS_TABLE = str.maketrans(char_map)
+
 def transliterate(src_text: str) -> str:
     """Return transliterated string"""
-    src_text = apply_regex_replacements(src_text, regex_patterns)
-    src_text = apply_replacements(src_text, char_map)
+    src_text = consonant_vowel_pattern.sub(lambda match: consonant_vowel_map[match.group()], src_text)
+    src_text = src_text.translate(_TRANS_TABLE)
     return src_text
@@ -1,7 +1,9 @@
 # GOST 7.79-2000 System B
 import re
-from .utils import apply_replacements, apply_regex_replacements
+from .utils import apply_regex_replacements
 
+# ц and Ц are deliberately absent: regex_patterns handles them after this
+# map has run, so the letter that follows is already Latin.
 char_map = {
     'а': 'a',
     'б': 'b',
@@ -69,17 +71,19 @@ char_map = {
     'Я': 'Ya',
 }
 
-# To handle цЦ.
+# Precomputed once at import; keep out of transliterate() so it is not rebuilt per call.
+_TRANS_TABLE = str.maketrans(char_map)
+
+# To handle цЦ: c before i, e, y, j and cz elsewhere. One pattern per
+# leading letter keeps the fast literal-prefix scan for each.
 regex_patterns = (
-    (re.compile(r'ц([ieyjIEYJ])'), r'c\1'),
-    (re.compile(r'Ц([ieyjIEYJ])'), r'C\1'),
-    (re.compile('ц'), 'cz'),
-    (re.compile('Ц'), 'Cz'),
+    (re.compile(r'ц([ieyjIEYJ])?'), lambda match: 'c' + match.group(1) if match.group(1) else 'cz'),
+    (re.compile(r'Ц([ieyjIEYJ])?'), lambda match: 'C' + match.group(1) if match.group(1) else 'Cz'),
 )
 
 def transliterate(src_text: str) -> str:
     """Return transliterated string"""
-    src_text = apply_replacements(src_text, char_map)
+    src_text = src_text.translate(_TRANS_TABLE)
     src_text = apply_regex_replacements(src_text, regex_patterns)
     return src_text
 
@@ -2,29 +2,36 @@
 # Ukrainian to English transliteration per the 2010
 # Resolution of the Cabinet of Ministers of Ukraine
 import re
-from .utils import apply_replacements, apply_regex_replacements
 
-# Special regex patterns for word-beginning cases
-regex_patterns = (
+# Special regex patterns for word-beginning cases, as (pattern, replacement)
+regex_replacements = (
     # Handle зг combination to distinguish from ж
-    (re.compile(r"Зг"), "Zgh"),
-    (re.compile(r"зг"), "zgh"),
-    (re.compile(r"ЗГ"), "ZGH"),
-    (re.compile(r"зГ"), "zGh"),
+    (r"Зг", "Zgh"),
+    (r"зг", "zgh"),
+    (r"ЗГ", "ZGH"),
+    (r"зГ", "zGh"),
 
     # Word-beginning special cases
-    (re.compile(r"\bЄ"), "Ye"),
-    (re.compile(r"\bє"), "ye"),
-    (re.compile(r"\bЮ"), "Yu"),
-    (re.compile(r"\bю"), "yu"),
-    (re.compile(r"\bЯ"), "Ya"),
-    (re.compile(r"\bя"), "ya"),
-    (re.compile(r"\bЇ"), "Yi"),
-    (re.compile(r"\bї"), "yi"),
-    (re.compile(r"\bЙ"), "Y"),
-    (re.compile(r"\bй"), "y"),
+    (r"\bЄ", "Ye"),
+    (r"\bє", "ye"),
+    (r"\bЮ", "Yu"),
+    (r"\bю", "yu"),
+    (r"\bЯ", "Ya"),
+    (r"\bя", "ya"),
+    (r"\bЇ", "Yi"),
+    (r"\bї", "yi"),
+    (r"\bЙ", "Y"),
+    (r"\bй", "y"),
 )
 
+# All of the above fused into one alternation so the text is scanned once;
+# the index of the group that matched selects the replacement.
+regex_pattern = re.compile("|".join(f"({pattern})" for pattern, _ in regex_replacements))
+_group_replacements = tuple(replacement for _, replacement in regex_replacements)
+
+def _replace_group(match, replacements=_group_replacements):
+    return replacements[match.lastindex - 1]
+
 char_map = {
     "А": "A",
     "а": "a",
@@ -96,8 +103,19 @@ char_map = {
     "’": "",
 }
 
+# Precomputed once at import; keep out of transliterate() so it is not rebuilt per call.
+_TRANS_TABLE = str.maketrans(char_map)
+
+# Every character either pass can change; the regex patterns only match
+# characters that are also char_map keys. Text without any is returned as is.
+_CONVERTIBLE_PATTERN = re.compile("[" + "".join(map(re.escape, char_map)) + "]")
+
 def transliterate(src_text: str) -> str:
     """Return transliterated string"""
-    src_text = apply_regex_replacements(src_text, regex_patterns)
-    src_text = apply_replacements(src_text, char_map)
-    return src_text
+    # The apostrophe is the only ASCII character in char_map
+    if src_text.isascii() and "'" not in src_text:
+        return src_text
+    if not _CONVERTIBLE_PATTERN.search(src_text):
+        return src_text
+    src_text = regex_pattern.sub(_replace_group, src_text)
+    return src_text.translate(_TRANS_TABLE)
@@ -1,28 +1,45 @@
 # utils.py
 import re
-from functools import lru_cache, partial
+from itertools import islice
 
-WORD_SPLIT_PATTERN = re.compile('(\W+)')
+WORD_SPLIT_PATTERN = re.compile(r'(\W+)')
+
+# Lookup structures built per replacement dict, keyed by id(). The dict itself
+# is kept in the entry so its id can't be reused. Replacement dicts are
+# module-level constants and must not be mutated after first use.
+_REPLACEMENT_CACHE = {}
+
+def _get_replacement_entry(replacements: dict) -> tuple:
+    """Return the cached (replacements, translate_table, pattern) entry for a dict.
+    Single-character maps get a translate table; others get a compiled
+    alternation pattern."""
+    entry = _REPLACEMENT_CACHE.get(id(replacements))
+    if entry is None:
+        # Multi-character keys (e.g. syllables) must be matched together with
+        # the single-character keys they start with, so only all-single-character
+        # maps can use str.translate.
+        if all(len(key) == 1 for key in replacements):
+            table, pattern = str.maketrans(replacements), None
+        else:
+            # Regular expression that matches the substrings to replace
+            table, pattern = None, re.compile("|".join(map(re.escape, replacements.keys())))
+        entry = _REPLACEMENT_CACHE[id(replacements)] = (replacements, table, pattern)
+    return entry
 
 def apply_replacements(src_text: str, replacements: dict) -> str:
-    """Apply character replacements to source text with error handling."""
-    if not isinstance(src_text, str):
-        raise TypeError("Source text must be a string")
-    if not isinstance(replacements, dict):
-        raise TypeError("Replacements must be a dictionary")
+    """Apply character replacements to source text.
+    Inputs are validated at the public entry points, not per call here."""
+    assert isinstance(src_text, str), "Source text must be a string"
     if not replacements:
         return src_text
     
-    try:
-        # Compile regular expression that matches the substrings to replace
-        pattern = re.compile("|".join(map(re.escape, replacements.keys())))
-        
-        # Use the pattern to replace each match in src_text
-        return pattern.sub(lambda match: replacements[match.group(0)], src_text)
-    except re.error as e:
-        raise ValueError(f"Invalid replacement pattern: {e}")
-    except Exception as e:
-        raise RuntimeError(f"Error applying replacements: {e}")
+    _, table, pattern = _get_replacement_entry(replacements)
+    if table is not None:
+        return src_text.translate(table)
+    
+    # Use the pattern to replace each match in src_text; the bound lookup is
+    # passed as a default argument to keep the per-match call short
+    return pattern.sub(lambda match, _get=replacements.__getitem__: _get(match.group()), src_text)
 
 
 # def apply_ordered_replacements(src_text: str, replacements: dict) -> str:
@@ -34,55 +51,73 @@ def apply_replacements(src_text: str, replacements: dict) -> str:
 
 
 def apply_regex_replacements(src_text: str, replacements: tuple) -> str:
-    """Apply regex replacements to source text with error handling."""
-    if not isinstance(src_text, str):
-        raise TypeError("Source text must be a string")
-    if not isinstance(replacements, (tuple, list)):
-        raise TypeError("Replacements must be a tuple or list")
+    """Apply regex replacements to source text."""
+    assert isinstance(src_text, str), "Source text must be a string"
     
-    try:
-        # Iterate over compiled pattern/replacement pairs and replace one by one.
-        for pattern, replacement in replacements:
-            if not hasattr(pattern, 'sub'):
-                raise ValueError("Pattern must be a compiled regex object")
-            src_text = pattern.sub(replacement, src_text)
-        return src_text
-    except Exception as e:
-        raise RuntimeError(f"Error applying regex replacements: {e}")
+    # Iterate over compiled pattern/replacement pairs and replace one by one.
+    for pattern, replacement in replacements:
+        src_text = pattern.sub(replacement, src_text)
+    return src_text
 
 
-@lru_cache(maxsize=10000)
 def translit_word_cm(word: str, translit_method) -> str:
-    """Return upper-cased transliteration for upper-cased src_text words."""
-    if not isinstance(word, str):
-        raise TypeError("Word must be a string")
-    if not hasattr(translit_method, 'transliterate'):
-        raise AttributeError("Transliteration method must have a 'transliterate' function")
-    
-    try:
-        if word.isupper():
-            return translit_method.transliterate(word).upper()
-        else:
-            return translit_method.transliterate(word)
-    except Exception as e:
-        raise RuntimeError(f"Error transliterating word '{word}': {e}")
+    """Return upper-cased transliteration for upper-cased src_text words.
+    Arguments are checked by transliterate_case_match."""
+    if word.isupper():
+        return translit_method.transliterate(word).upper()
+    return translit_method.transliterate(word)
+
+
+# Per-method word caches, keyed by id(). Each cache keeps a reference to its
+# method so the id can't be reused.
+_WORD_CACHES = {}
+_WORD_CACHE_SIZE = 10_000
+_WORD_CACHE_EVICT_BATCH = 1024
+
+class _WordCache(dict):
+    """Memo of translit_word_cm results for a single method. A hit is a plain
+    dict lookup; a miss computes the word and, once the cache is full, first
+    drops a batch of the oldest entries (dicts iterate in insertion order)."""
+    __slots__ = ('translit_method',)
+
+    def __init__(self, translit_method):
+        super().__init__()
+        self.translit_method = translit_method
+
+    def __missing__(self, word: str) -> str:
+        if len(self) >= _WORD_CACHE_SIZE:
+            # popitem() would drop the newest words; evict from the front instead
+            for key in list(islice(self, _WORD_CACHE_EVICT_BATCH)):
+                del self[key]
+        result = self[word] = translit_word_cm(word, self.translit_method)
+        return result
+
+
+def _get_word_cache(translit_method) -> _WordCache:
+    """Return the word cache for a method, creating it on first use."""
+    cache = _WORD_CACHES.get(id(translit_method))
+    if cache is None:
+        cache = _WORD_CACHES[id(translit_method)] = _WordCache(translit_method)
+    return cache
 
 
 def transliterate_case_match(src_text: str, translit_method) -> str:
     """Return upper-cased transliteration for upper-cased src_text words.
     Used when translit_method sometimes uses digraphs, etc., to represent
     single letters from the src_text in the target string. Wraps the 
-    the translit_word_cm function above for efficiency."""
+    the translit_word_cm function above for efficiency. translit_method is
+    expected to come from MethodRegistry.get_method, which has already
+    checked that it provides a callable transliterate()."""
     
     if not isinstance(src_text, str):
         raise TypeError("Source text must be a string")
-    if not hasattr(translit_method, 'transliterate'):
-        raise AttributeError("Transliteration method must have a 'transliterate' function")
     
     try:
         words = WORD_SPLIT_PATTERN.split(src_text)
-        translit_func = partial(translit_word_cm, translit_method=translit_method)
+        cache = _get_word_cache(translit_method)
         
-        return ''.join([translit_func(word) for word in words])
+        # split() yields an empty string when the text starts or ends with a
+        # separator; it transliterates to nothing, so skip it
+        return ''.join([cache[word] for word in words if word])
     except Exception as e:
         raise RuntimeError(f"Error during case-match transliteration: {e}")
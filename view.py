@@ -2,6 +2,7 @@ from config_manager import ConfigManager
 import wx
 import os
 import logging
+from collections import deque
 from typing import List, Dict, Optional, Any
 from wx.adv import AboutDialogInfo, AboutBox
 from constants import UIStrings, AppConfig
@@ -25,6 +26,10 @@ class XlitToolView(wx.Frame):
         self.current_font_size = self.config_manager.get_font_size()
         self.app_dir = os.path.dirname(os.path.abspath(__file__))
         self.method_mapping = {}  # Maps display names to full method names
+        self._method_reverse = {}  # Maps full method names to display names
+        self._combo_index = {}  # Maps method display names to their choice index
+        self._language_index = {}  # Maps languages to their choice index
+        self._display_name_cache = {}  # Maps full method names to display names seen so far
         
         # Bind close event to save window state
         self.Bind(wx.EVT_CLOSE, self.on_close)
@@ -46,24 +51,34 @@ class XlitToolView(wx.Frame):
         self.main_panel.SetSizer(main_sizer)
 
     def set_font_recursive(self, container: wx.Window, new_font: wx.Font) -> None:
-        """Recursively apply new font to all components within a container."""
-        for child in container.GetChildren():
+        """Apply new font to all components within a container.
+        Walks the widget tree breadth-first with a queue instead of recursing."""
+        button_class = wx.Button
+        pending = deque(container.GetChildren())
+        while pending:
+            child = pending.popleft()
             child.SetFont(new_font)
-            if hasattr(child, 'GetChildren') and child.GetChildren():
-                self.set_font_recursive(child, new_font)
-            if isinstance(child, wx.Button):
+            grandchildren = child.GetChildren()
+            if grandchildren:
+                pending.extend(grandchildren)
+            if isinstance(child, button_class):
                 child.SetInitialSize(child.GetBestSize())
 
     def apply_font_size(self, font_size: int) -> None:
         new_font = wx.Font(font_size, wx.DEFAULT, wx.NORMAL, wx.NORMAL)
-        self.set_font_recursive(self, new_font)
-        menubar = self.GetMenuBar()
-        for i in range(menubar.GetMenuCount()):
-            menu = menubar.GetMenu(i)
-            for item in menu.GetMenuItems():
-                item.SetFont(new_font)
-        self.Layout()
-        self.main_panel.GetSizer().Layout()
+        # Suspend repaints until every widget and menu item has the new font
+        self.Freeze()
+        try:
+            self.set_font_recursive(self, new_font)
+            menubar = self.GetMenuBar()
+            for i in range(menubar.GetMenuCount()):
+                menu = menubar.GetMenu(i)
+                for item in menu.GetMenuItems():
+                    item.SetFont(new_font)
+            self.Layout()
+            self.main_panel.GetSizer().Layout()
+        finally:
+            self.Thaw()
 
     def on_font_size(self, event: wx.CommandEvent) -> None:
         font_size = int(event.GetEventObject().GetLabel(event.GetId())[:-2])
@@ -198,62 +213,63 @@ class XlitToolView(wx.Frame):
 
     def on_close(self, event: wx.CloseEvent) -> None:
         """Handle window close event to save state."""
-        # Save window size and position
-        self.config_manager.set_window_size(self.GetSize())
-        self.config_manager.set_window_position(self.GetPosition())
-        
-        # Save current selections
+        # Collect current selections
+        selected_language = None
         if hasattr(self, 'language_combo'):
             selected_language = self.get_selected_language()
-            if selected_language and selected_language != UIStrings.SELECT_LANGUAGE:
-                self.config_manager.set_last_selected_language(selected_language)
+            if selected_language in UIStrings.PLACEHOLDERS:
+                selected_language = None
         
+        selected_method = None
         if hasattr(self, 'combo'):
             selected_method = self.get_selected_method()
-            if selected_method:
-                self.config_manager.set_last_selected_method(selected_method)
+        
+        # Save window size, position and selections with a single flush
+        self.config_manager.save_session(
+            self.GetSize(), self.GetPosition(), selected_language, selected_method
+        )
         
         # Continue with normal close
         event.Skip()
 
     def restore_user_selections(self) -> None:
         """Restore the user's last selections."""
-        # Restore language selection
-        last_language = self.config_manager.get_last_selected_language()
-        if last_language:
-            for i in range(self.language_combo.GetCount()):
-                if self.language_combo.GetString(i) == last_language:
-                    self.language_combo.SetSelection(i)
-                    # Trigger language change to populate methods
+        # Both restores re-populate widgets; repaint once at the end
+        self.Freeze()
+        try:
+            # Restore language selection
+            last_language = self.config_manager.get_last_selected_language()
+            language_index = self._language_index.get(last_language) if last_language else None
+            if language_index is not None:
+                self.language_combo.SetSelection(language_index)
+                # Trigger language change to populate methods
+                if hasattr(self, 'controller'):
+                    event = wx.CommandEvent(wx.wxEVT_COMMAND_CHOICE_SELECTED)
+                    event.SetEventObject(self.language_combo)
+                    self.controller._handle_language_change(event)
+            
+            # If we have a language selected and methods are available, restore method selection
+            if last_language:
+                last_method = self.config_manager.get_last_selected_method()
+                # Find the display name for this method, then its position in the choice
+                display_name = self._method_reverse.get(last_method) if last_method else None
+                method_index = self._combo_index.get(display_name) if display_name else None
+                if method_index is not None:
+                    self.combo.SetSelection(method_index)
+                    # Trigger method change to update UI state
                     if hasattr(self, 'controller'):
                         event = wx.CommandEvent(wx.wxEVT_COMMAND_CHOICE_SELECTED)
-                        event.SetEventObject(self.language_combo)
-                        self.controller._handle_language_change(event)
-                    break
-        
-        # If we have a language selected and methods are available, restore method selection
-        if last_language and hasattr(self, 'method_mapping'):
-            last_method = self.config_manager.get_last_selected_method()
-            if last_method:
-                # Find the display name for this method
-                for display_name, full_name in self.method_mapping.items():
-                    if full_name == last_method:
-                        for i in range(self.combo.GetCount()):
-                            if self.combo.GetString(i) == display_name:
-                                self.combo.SetSelection(i)
-                                # Trigger method change to update UI state
-                                if hasattr(self, 'controller'):
-                                    event = wx.CommandEvent(wx.wxEVT_COMMAND_CHOICE_SELECTED)
-                                    event.SetEventObject(self.combo)
-                                    self.controller._handle_combobox_change(event)
-                                break
-                        break
+                        event.SetEventObject(self.combo)
+                        self.controller._handle_combobox_change(event)
+        finally:
+            self.Thaw()
 
     def set_languages(self, languages: List[str]) -> None:
         """Set the available languages in the language combobox."""
-        self.language_combo.Clear()
-        for language in languages:
-            self.language_combo.Append(language)
+        # Set() clears and refills the choice in a single native call
+        self.language_combo.Set(languages)
+        # First occurrence wins, as with a linear scan of the choice
+        self._language_index = {language: i for i, language in reversed(list(enumerate(languages)))}
         
         # Set the first item ("Select language") as the default selection
         if len(languages) > 0:
@@ -261,16 +277,23 @@ class XlitToolView(wx.Frame):
 
     def set_transliteration_methods(self, methods: List[str], model: Optional[Any] = None) -> None:
         """Set the available transliteration methods in the method choice."""
-        self.combo.Clear()
-        self.method_mapping = {}  # Clear previous mapping
-        
-        for method in methods:
-            if model:
-                display_name = model.get_method_display_name(method)
-            else:
-                display_name = method
-            self.combo.Append(display_name)
-            self.method_mapping[display_name] = method
+        if model:
+            # Display names depend only on the method, so they stay valid across
+            # language changes and are looked up once per session
+            cache = self._display_name_cache
+            display_names = []
+            for method in methods:
+                display_name = cache.get(method)
+                if display_name is None:
+                    display_name = cache[method] = model.get_method_display_name(method)
+                display_names.append(display_name)
+        else:
+            display_names = list(methods)
+        self.combo.Set(display_names)
+        self.method_mapping = dict(zip(display_names, methods))  # Replaces previous mapping
+        # Reverse lookups for restoring a saved method without scanning the choice
+        self._method_reverse = {method: display_name for display_name, method in self.method_mapping.items()}
+        self._combo_index = {display_name: i for i, display_name in reversed(list(enumerate(display_names)))}
         
         # Enable the method combo if methods are available
         self.combo.Enable(len(methods) > 0)